@@ -1,10 +1,9 @@
 import re
 import concurrent.futures
-from urllib.parse import urlparse
 
 from core.dom import dom
 from core.log import setup_logger
-from core.utils import getUrl, getParams
+from core.utils import getUrl, getParams, parse_url
 from core.requester import requester
 from core.zetanize import zetanize
 from plugins.retireJs import retireJs
@@ -16,8 +15,9 @@ def photon(seedUrl, headers, level, threadCount, delay, timeout, skipDOM):
     forms = []  # web forms
     processed = set()  # urls that have been crawled
     storage = set()  # urls that belong to the target i.e. in-scope
-    schema = urlparse(seedUrl).scheme  # extract the scheme e.g. http or https
-    host = urlparse(seedUrl).netloc  # extract the host e.g. example.com
+    parsed = parse_url(seedUrl)
+    schema = parsed.scheme  # extract the scheme e.g. http or https
+    host = parsed.netloc  # extract the host e.g. example.com
     main_url = schema + '://' + host  # join scheme and host to make the root url
     storage.add(seedUrl)  # add the url to storage
     checkedDOMs = []
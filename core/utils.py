@@ -2,6 +2,7 @@ import json
 import random
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -49,6 +50,12 @@ def find_db_file(filename):
     return None
 
 
+@lru_cache(maxsize=1024)
+def parse_url(url):
+    """urlparse() with caching, crawlers keep parsing the same hosts"""
+    return urlparse(url)
+
+
 def converter(data, url=False):
     if 'str' in str(type(data)):
         if url:
@@ -243,10 +250,12 @@ def writer(obj, path):
 
 
 def reader(path):
-    with open(path, 'r') as f:
-        result = [line.rstrip(
-                    '\n').encode('utf-8').decode('utf-8') for line in f]
-    return result
+    """Lazily yield the non-empty lines of a file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if line:
+                yield line
 
 def js_extractor(response):
     """Extract js files from the response body"""
@@ -259,14 +268,14 @@ def js_extractor(response):
 
 
 def handle_anchor(parent_url, url):
-    scheme = urlparse(parent_url).scheme
+    parsed = parse_url(parent_url)
+    scheme = parsed.scheme
     if url[:4] == 'http':
         return url
     elif url[:2] == '//':
         return scheme + ':' + url
     elif url.startswith('/'):
-        host = urlparse(parent_url).netloc
-        scheme = urlparse(parent_url).scheme
+        host = parsed.netloc
         parent_url = scheme + '://' + host
         return parent_url + url
     elif parent_url.endswith('/'):
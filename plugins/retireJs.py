@@ -5,7 +5,7 @@ from urllib.parse import urlparse
 
 from core.colors import green, end
 from core.requester import requester
-from core.utils import deJSON, js_extractor, handle_anchor, getVar, updateVar
+from core.utils import deJSON, js_extractor, handle_anchor, getVar
 from core.log import setup_logger
 
 logger = setup_logger(__name__)
@@ -199,9 +199,10 @@ def main_scanner(uri, response):
 
 def retireJs(url, response):
     scripts = js_extractor(response)
+    checkedScripts = getVar('checkedScripts')
     for script in scripts:
-        if script not in getVar('checkedScripts'):
-            updateVar('checkedScripts', script, 'add')
+        if script not in checkedScripts:
+            checkedScripts.add(script)
             uri = handle_anchor(url, script)
             response = requester(uri, '', getVar('headers'), True, getVar('delay'), getVar('timeout')).text
             result = main_scanner(uri, response)
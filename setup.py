@@ -4,7 +4,7 @@ Setup script for XSStrike
 Advanced XSS Detection Suite
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 import os
 import re
 
@@ -12,6 +12,12 @@ import re
 def read_version():
     pyproject_path = os.path.join(os.path.dirname(__file__), 'pyproject.toml')
     if os.path.exists(pyproject_path):
+        try:
+            import tomllib  # Python 3.11+
+            with open(pyproject_path, 'rb') as f:
+                return tomllib.load(f)['project']['version']
+        except Exception:
+            pass  # Older Python or malformed file, fall back to the regex
         with open(pyproject_path, 'r', encoding='utf-8') as f:
             content = f.read()
             match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
@@ -32,7 +38,7 @@ def read_requirements():
     requirements_path = os.path.join(os.path.dirname(__file__), 'requirements.txt')
     if os.path.exists(requirements_path):
         with open(requirements_path, 'r', encoding='utf-8') as f:
-            requirements = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+            requirements = [line for line in (raw.strip() for raw in f) if line and not line.startswith('#')]
         return requirements
     return []
 
@@ -46,8 +52,7 @@ setup(
     author_email='',
     url='https://github.com/s0md3v/XSStrike',
     license='GPL-3.0',
-    packages=find_packages(exclude=['tests', '*.tests', '*.tests.*', 'tests.*']),
-    py_modules=['xsstrike'],
+    # packages and py_modules are declared in pyproject.toml [tool.setuptools]
     # install_requires is read from pyproject.toml [project.dependencies] automatically
     extras_require={
         'dev': [
@@ -72,9 +77,6 @@ setup(
         'Topic :: Security :: Cryptography',
         'License :: OSI Approved :: GNU General Public License v3 (GPLv3)',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.6',
-        'Programming Language :: Python :: 3.7',
-        'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9',
         'Programming Language :: Python :: 3.10',
         'Programming Language :: Python :: 3.11',
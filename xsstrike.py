@@ -1,64 +1,100 @@
 #!/usr/bin/env python3
 
 import argparse
+import hashlib
 import json
+import marshal
 import sys
 import signal
 import os
-
-# Try importing Rich for a better UI, otherwise exit
-try:
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.progress import track
-    console = Console()
-except ImportError:
-    print("Error: The 'rich' library is required. Install it with: pip install rich")
-    sys.exit(1)
-
-# Python Version Check (Modern approach)
-if sys.version_info < (3, 6): # 3.4 is too old, set baseline to 3.6+
-    console.print("[bold red]Error:[/bold red] XSStrike requires Python 3.6 or higher.")
-    sys.exit(1)
+import time
+from functools import partial
+from itertools import zip_longest
 
 # Local imports (Kept original structure)
 try:
+    # Plain ANSI output, importing Rich here would cost more than the whole CLI setup
+    from core.colors import red, yellow, end
     from core.config import blindPayload, headers, timeout, threadCount, delay
     from core.encoders import base64
-    from core.photon import photon
     from core.prompt import prompt
-    from core.updater import updater
-    from core.utils import converter, extractHeaders, reader, find_db_file
-    from modes.bruteforcer import bruteforcer
-    from modes.crawl import crawl
-    from modes.scan import scan
-    from modes.singleFuzz import singleFuzz
+    from core.utils import converter, extractHeaders, reader, find_db_file, parse_url
     import core.config
     import core.log
 except ImportError as e:
-    console.print(f"[bold red]Import Error:[/bold red] Failed to load core modules. \nDetails: {e}")
+    # core.colors itself may be what failed, so no colours here
+    print(f"Import Error: Failed to load core modules. \nDetails: {e}", file=sys.stderr)
     sys.exit(1)
 
-# External Dependencies Check
-try:
-    import concurrent.futures
-    from urllib.parse import urlparse
-    import fuzzywuzzy
-except ImportError as e:
-    console.print(f"[bold red]Missing dependency:[/bold red] {e.name}")
-    console.print(f"[yellow]Please run:[/yellow] pip3 install -r requirements.txt")
-    sys.exit(1) # Exit with error (1)
+# DB path is resolved once per process
+_DEFINITIONS_PATH = find_db_file('definitions.json')
+
+# Payload encoders selectable with -e/--encode
+_ENCODERS = {'base64': base64}
+
+# Crawler progress is reported at most every _PROGRESS_INTERVAL seconds
+_PROGRESS_INTERVAL = 0.2
+_PROGRESS_TEMPLATE = 'Progress: %d/%d\r'
+
+def check_dependencies():
+    """Checks third-party dependencies only needed by the scanning modes"""
+    try:
+        import fuzzywuzzy
+    except ImportError as e:
+        print(f"{red}Missing dependency:{end} {e.name}", file=sys.stderr)
+        print(f"{yellow}Please run:{end} pip3 install -r requirements.txt", file=sys.stderr)
+        sys.exit(1) # Exit with error (1)
 
 def show_banner():
-    """Displays the banner using Rich"""
-    banner_text = """
-    XSStrike v3.1.7
-    Advanced XSS Detection Suite
-    """
-    console.print(Panel(banner_text, style="bold red", subtitle="Refactored Version"))
+    """Displays the banner"""
+    print(f"{red}XSStrike v3.1.7 - Advanced XSS Detection Suite{end}")
 
-def setup_args():
-    """Sets up argparse"""
+def _definitions_cache_file(definitions_file):
+    """Per-user cache location for a given definitions.json"""
+    cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    key = hashlib.sha1(str(definitions_file).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir, 'xsstrike', f'definitions-{key}.marshal')
+
+def load_definitions(definitions_file):
+    """Loads the definitions DB, using a marshalled copy from the user cache when it is current"""
+    definitions_file = os.path.realpath(definitions_file)
+    mtime = os.path.getmtime(definitions_file)
+    cache_file = _definitions_cache_file(definitions_file)
+    try:
+        with open(cache_file, 'rb') as cache:
+            cached = marshal.load(cache)
+        if cached['path'] == definitions_file and cached['mtime'] == mtime:
+            return cached['definitions']
+    except Exception:
+        pass # Missing, stale, corrupted or incompatible cache, fall back to JSON
+
+    # orjson is optional and only needed on a cache miss, so import it here
+    try:
+        import orjson
+    except ImportError:
+        with open(definitions_file, 'r') as db_file:
+            definitions = json.load(db_file)
+    else:
+        with open(definitions_file, 'rb') as db_file:
+            definitions = orjson.loads(db_file.read())
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, 'wb') as cache:
+            marshal.dump({'path': definitions_file, 'mtime': mtime, 'definitions': definitions}, cache)
+    except (OSError, ValueError):
+        pass # Unwritable cache directory, just skip caching
+    return definitions
+
+# Argparse defaults and choices, resolved once at import
+_LOG_CHOICES = tuple(core.log.log_config.keys())
+_DEF_TIMEOUT = core.config.timeout
+_DEF_THREADS = core.config.threadCount
+_DEF_DELAY = core.config.delay
+_DEF_CONSOLE_LOG_LEVEL = core.log.console_log_level
+_DEF_LOG_FILE = core.log.log_file
+
+def _build_parser():
+    """Builds the argparse parser"""
     parser = argparse.ArgumentParser(
         description="XSStrike Advanced XSS Scanner",
         epilog="""
@@ -107,7 +143,7 @@ Examples:
     parser.add_argument('--update', help='Update XSStrike', dest='update', action='store_true')
     
     # Execution settings
-    parser.add_argument('--timeout', help='Timeout in seconds (default: from config)', dest='timeout', type=int, default=core.config.timeout)
+    parser.add_argument('--timeout', help='Timeout in seconds (default: from config)', dest='timeout', type=int, default=_DEF_TIMEOUT)
     parser.add_argument('--proxy', help='Use proxy', dest='proxy', action='store_true')
     parser.add_argument('--crawl', help='Crawl mode - crawl and test all forms/URLs found', dest='recursive', action='store_true')
     parser.add_argument('--json', help='Treat POST data as JSON', dest='jsonData', action='store_true')
@@ -118,8 +154,8 @@ Examples:
     parser.add_argument('-f', '--file', help='Load payloads from file (e.g., payloads.txt)', dest='args_file')
     parser.add_argument('-l', '--level', help='Crawl level depth (default: 2)', dest='level', type=int, default=2)
     parser.add_argument('--headers', help='Add custom headers (e.g., "Cookie: session=abc" or use without value for interactive prompt)', dest='add_headers', nargs='?', const=True)
-    parser.add_argument('-t', '--threads', help='Number of threads (default: from config)', dest='threadCount', type=int, default=core.config.threadCount)
-    parser.add_argument('-d', '--delay', help='Delay between requests in seconds (default: from config)', dest='delay', type=int, default=core.config.delay)
+    parser.add_argument('-t', '--threads', help='Number of threads (default: from config)', dest='threadCount', type=int, default=_DEF_THREADS)
+    parser.add_argument('-d', '--delay', help='Delay between requests in seconds (default: from config)', dest='delay', type=int, default=_DEF_DELAY)
     
     # Boolean Flags
     parser.add_argument('--skip', help='Don\'t ask to continue scanning', dest='skip', action='store_true')
@@ -128,22 +164,25 @@ Examples:
     
     # Logging
     parser.add_argument('--console-log-level', help='Console logging level', dest='console_log_level', 
-                        default=core.log.console_log_level, choices=core.log.log_config.keys())
+                        default=_DEF_CONSOLE_LOG_LEVEL, choices=_LOG_CHOICES)
     parser.add_argument('--file-log-level', help='File logging level', dest='file_log_level',
-                        choices=core.log.log_config.keys(), default=None)
-    parser.add_argument('--log-file', help='Log file name', dest='log_file', default=core.log.log_file)
+                        choices=_LOG_CHOICES, default=None)
+    parser.add_argument('--log-file', help='Log file name', dest='log_file', default=_DEF_LOG_FILE)
     
-    return parser.parse_args()
+    return parser
+
+_PARSER = _build_parser()
+
+def setup_args():
+    """Parses the command line arguments"""
+    return _PARSER.parse_args()
 
 def handle_sigint(signal, frame):
     """Handles Ctrl+C for a clean exit"""
-    console.print("\n[bold yellow]Aborted by user.[/bold yellow]")
+    print(f"\n{yellow}Aborted by user.{end}", file=sys.stderr)
     sys.exit(0)
 
 def main():
-    # Register Ctrl+C signal
-    signal.signal(signal.SIGINT, handle_sigint)
-
     # Initial Setup
     show_banner()
     args = setup_args()
@@ -154,40 +193,42 @@ def main():
     core.log.log_file = args.log_file
     logger = core.log.setup_logger()
 
-    # Mapping args to global config (Required for XSStrike internals)
-    core.config.globalVariables = vars(args)
-
     # Headers Logic
     current_headers = core.config.headers # Default
-    if isinstance(args.add_headers, bool):
+    if args.add_headers is True: # --headers given without a value
         current_headers = extractHeaders(prompt())
-    elif isinstance(args.add_headers, str):
+    elif args.add_headers is not None:
         current_headers = extractHeaders(args.add_headers)
-    
-    core.config.globalVariables['headers'] = current_headers
-    core.config.globalVariables['checkedScripts'] = set()
-    core.config.globalVariables['checkedForms'] = {}
-    
+
     # Loading DB definitions
-    definitions_file = find_db_file('definitions.json')
     try:
-        if definitions_file:
-            with open(definitions_file, 'r') as db_file:
-                core.config.globalVariables['definitions'] = json.load(db_file)
+        if _DEFINITIONS_PATH:
+            definitions = load_definitions(_DEFINITIONS_PATH)
         else:
             raise FileNotFoundError("db/definitions.json not found")
     except FileNotFoundError:
-        console.print("[bold red]Critical Error:[/bold red] db/definitions.json not found.")
+        print(f"{red}Critical Error:{end} db/definitions.json not found.", file=sys.stderr)
         sys.exit(1)
 
+    # Mapping args to global config (Required for XSStrike internals)
+    global_vars = vars(args)
+    global_vars['headers'] = current_headers
+    # A plain set is already the cheapest membership + add structure, callers
+    # should grab it once and use `in`/add() directly (see plugins.retireJs)
+    global_vars['checkedScripts'] = set()
+    global_vars['checkedForms'] = {}
+    global_vars['definitions'] = definitions
+    core.config.globalVariables = global_vars
+
     # Update Logic
     if args.update:
+        from core.updater import updater
         updater()
         sys.exit(0)
 
     # Check if target is specified
     if not args.target and not args.args_seeds:
-        console.print("[yellow]No target specified.[/yellow] Use -h for help.")
+        print(f"{yellow}No target specified.{end} Use -h for help.", file=sys.stderr)
         sys.exit(1) # User input error is an error (1)
 
     # Data Processing (ParamData)
@@ -202,75 +243,91 @@ def main():
     payloadList = core.config.payloads
     if args.args_file:
         if args.args_file != 'default':
-            payloadList = list(filter(None, reader(args.args_file)))
+            payloadList = list(reader(args.args_file))
 
     # Seeds
     seedList = []
     if args.args_seeds:
-        seedList = list(filter(None, reader(args.args_seeds)))
+        seedList = list(reader(args.args_seeds))
 
     # Encoding
-    encoding = base64 if args.encode and args.encode == 'base64' else False
+    encoding = _ENCODERS.get(args.encode, False)
     
     if not args.proxy:
         core.config.proxies = {}
 
     # --- MAIN EXECUTION FLOW ---
+    # Scanner modules are imported lazily so that --help/--update stay fast
+    check_dependencies()
 
     if args.fuzz:
+        from modes.singleFuzz import singleFuzz
         singleFuzz(args.target, local_param_data, encoding, current_headers, args.delay, args.timeout)
     
     elif not args.recursive and not args.args_seeds:
         if args.args_file:
+            from modes.bruteforcer import bruteforcer
             bruteforcer(args.target, local_param_data, payloadList, encoding, current_headers, args.delay, args.timeout)
         else:
+            from modes.scan import scan
             scan(args.target, local_param_data, encoding, current_headers, args.delay, args.timeout, args.skipDOM, args.skip)
     
     else:
         # Crawler Mode
+        import concurrent.futures
+        from core.photon import photon
+        from modes.crawl import crawl
+
         if args.target:
             seedList.append(args.target)
         
-        for target_url in seedList:
-            logger.run(f'Crawling target: {target_url}')
-            parsed = urlparse(target_url)
-            scheme = parsed.scheme
-            host = parsed.netloc
-            main_url = f"{scheme}://{host}"
-            
-            # Photon Crawler
-            crawlingResult = photon(target_url, current_headers, args.level, 
-                                  args.threadCount, args.delay, args.timeout, args.skipDOM)
-            
-            forms = crawlingResult[0]
-            domURLs = list(crawlingResult[1])
-            
-            # List normalization for zip function
-            difference = abs(len(domURLs) - len(forms))
-            if len(domURLs) > len(forms):
-                forms.extend([0] * difference)
-            elif len(forms) > len(domURLs):
-                domURLs.extend([0] * difference)
-            
-            # Concurrent Execution
-            with concurrent.futures.ThreadPoolExecutor(max_workers=args.threadCount) as executor:
-                futures = []
-                for form, domURL in zip(forms, domURLs):
-                    futures.append(executor.submit(
-                        crawl, scheme, host, main_url, form, 
-                        args.blindXSS, blindPayload, current_headers, 
-                        args.delay, args.timeout, encoding
-                    ))
+        def crawl_form(crawler, form):
+            """Runs a single crawl task, one failing form must not abort the whole crawl"""
+            try:
+                crawler(form)
+            except Exception as e:
+                logger.warning(f'Skipping form after error: {e}')
+
+        # One pool for all seeds, worker threads are reused instead of respawned per seed
+        with concurrent.futures.ThreadPoolExecutor(max_workers=args.threadCount) as executor:
+            for target_url in seedList:
+                logger.run(f'Crawling target: {target_url}')
+                parsed = parse_url(target_url)
+                scheme = parsed.scheme
+                host = parsed.netloc
+                main_url = f"{scheme}://{host}"
+                
+                # Photon Crawler
+                crawlingResult = photon(target_url, current_headers, args.level, 
+                                      args.threadCount, args.delay, args.timeout, args.skipDOM)
+                
+                forms = crawlingResult[0]
+                domURLs = list(crawlingResult[1])
+                
+                # Concurrent Execution
+                crawler = partial(crawl, scheme, host, main_url,
+                                  blindXSS=args.blindXSS, blindPayload=blindPayload, headers=current_headers,
+                                  delay=args.delay, timeout=args.timeout, encoding=encoding)
+                results = executor.map(
+                    partial(crawl_form, crawler),
+                    (form for form, domURL in zip_longest(forms, domURLs, fillvalue=0)))
                 
                 # Simplified Progress Bar
-                completed = 0
-                total = len(forms)
-                for _ in concurrent.futures.as_completed(futures):
-                    completed += 1
-                    if completed == total or completed % args.threadCount == 0:
-                        logger.info(f'Progress: {completed}/{total}\r')
-            
-            logger.no_format('')
+                total = max(len(forms), len(domURLs))
+                last_update = 0.0
+                for completed, _ in enumerate(results, 1):
+                    now = time.monotonic()
+                    if completed == total or now - last_update > _PROGRESS_INTERVAL:
+                        logger.info(_PROGRESS_TEMPLATE % (completed, total))
+                        last_update = now
+                
+                logger.no_format('')
+
+def cli():
+    """Console entry point, installs the Ctrl+C handler before running main()"""
+    # Register Ctrl+C signal
+    signal.signal(signal.SIGINT, handle_sigint)
+    main()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    cli()
\ No newline at end of file